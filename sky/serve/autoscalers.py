@@ -1,11 +1,14 @@
 """Autoscalers: perform autoscaling by monitoring metrics."""
-import bisect
 import dataclasses
 import enum
-import math
+import fractions
+import logging
+import threading
 import time
 import typing
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
 
 from sky import sky_logging
 from sky.serve import constants
@@ -18,13 +21,26 @@ if typing.TYPE_CHECKING:
 
 logger = sky_logging.init_logger(__name__)
 
+# Batches of request timestamps larger than this are counted into the request
+# buckets with numpy. For smaller batches, the overhead of converting to numpy
+# arrays outweighs the speedup over a plain Python loop.
+_NUMPY_TIMESTAMPS_BATCH_SIZE = 1000
+
+# The position of each status in `ReplicaStatus.scale_down_decision_order()`.
+# Computed once so sorting replicas does not search the order list for every
+# replica.
+_SCALE_DOWN_STATUS_RANK: Dict[serve_state.ReplicaStatus, int] = {
+    status: rank for rank, status in enumerate(
+        serve_state.ReplicaStatus.scale_down_decision_order())
+}
+
 
 class AutoscalerDecisionOperator(enum.Enum):
     SCALE_UP = 'scale_up'
     SCALE_DOWN = 'scale_down'
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class AutoscalerDecision:
     """Autoscaling decisions.
 
@@ -36,29 +52,21 @@ class AutoscalerDecision:
     | SCALE_DOWN | int                       | Replica id to remove          |
     |------------------------------------------------------------------------|
     """
+    # TODO(MaoZiming): Add a doc to elaborate on autoscaling policies.
     operator: AutoscalerDecisionOperator
     target: Union[Optional[Dict[str, Any]], int]
 
-    # TODO(MaoZiming): Add a doc to elaborate on autoscaling policies.
-    def __init__(self, operator: AutoscalerDecisionOperator,
-                 target: Union[Optional[Dict[str, Any]], int]):
-        if operator == AutoscalerDecisionOperator.SCALE_UP:
-            assert (target is None or isinstance(target, dict))
-        else:
-            assert isinstance(target, int)
-        self.operator = operator
-        self.target = target
-
     def __repr__(self) -> str:
         return f'AutoscalerDecision({self.operator}, {self.target})'
 
 
 def _generate_scale_up_decisions(
         num: int, target: Optional[Dict[str, Any]]) -> List[AutoscalerDecision]:
-    return [
-        AutoscalerDecision(AutoscalerDecisionOperator.SCALE_UP, target)
-        for _ in range(num)
-    ]
+    assert target is None or isinstance(target, dict), target
+    # All scale up decisions are identical and decisions are immutable, so
+    # share a single instance instead of constructing one per replica.
+    decision = AutoscalerDecision(AutoscalerDecisionOperator.SCALE_UP, target)
+    return [decision] * num
 
 
 def _generate_scale_down_decisions(
@@ -93,23 +101,33 @@ def _select_nonterminal_replicas_to_scale_down(
     Returns:
         The list of replica ids to scale down.
     """
-    replicas = list(replica_infos)
-    status_order = serve_state.ReplicaStatus.scale_down_decision_order()
-    assert all(info.status in status_order for info in replicas), (
-        'All replicas to scale down should be in provisioning or launched '
-        'status.', replicas)
-    replicas = sorted(
-        replicas,
-        key=lambda info: (
-            status_order.index(info.status),
-            # version in ascending order
-            info.version,
-            # replica_id in descending order, i.e. launched order
-            -info.replica_id))
-    assert len(replicas) >= num_replica_to_scale_down, (
+    # Bucket the replicas by status in a single pass, so we only need to sort
+    # the buckets that are actually used to reach the number of replicas to
+    # scale down. Each bucket holds plain (version, -replica_id) tuples, so
+    # the replica attributes are read once and the sort compares tuples
+    # without a key function.
+    buckets: List[List[Tuple[int, int]]] = [[] for _ in _SCALE_DOWN_STATUS_RANK]
+    num_replicas = 0
+    for info in replica_infos:
+        rank = _SCALE_DOWN_STATUS_RANK.get(info.status)
+        assert rank is not None, (
+            'All replicas to scale down should be in provisioning or launched '
+            'status.', info)
+        # version in ascending order, then replica_id in descending order,
+        # i.e. launched order.
+        buckets[rank].append((info.version, -info.replica_id))
+        num_replicas += 1
+    assert num_replicas >= num_replica_to_scale_down, (
         'Not enough replicas to scale down. Available replicas: ',
-        f'{replicas}, num_replica_to_scale_down: {num_replica_to_scale_down}.')
-    return [info.replica_id for info in replicas][:num_replica_to_scale_down]
+        f'{num_replicas}, num_replica_to_scale_down: '
+        f'{num_replica_to_scale_down}.')
+    replica_ids: List[int] = []
+    for bucket in buckets:
+        if len(replica_ids) >= num_replica_to_scale_down:
+            break
+        bucket.sort()
+        replica_ids.extend(-neg_replica_id for _, neg_replica_id in bucket)
+    return replica_ids[:num_replica_to_scale_down]
 
 
 class Autoscaler:
@@ -131,9 +149,7 @@ class Autoscaler:
             update_mode: Update mode for the service.
         """
         self._service_name: str = service_name
-        self.min_replicas: int = spec.min_replicas
-        self.max_replicas: int = (spec.max_replicas if spec.max_replicas
-                                  is not None else spec.min_replicas)
+        self._setup_replica_bounds(spec)
         # Target number of replicas is initialized to min replicas
         self.target_num_replicas: int = spec.min_replicas
         self.latest_version: int = constants.INITIAL_VERSION
@@ -143,6 +159,12 @@ class Autoscaler:
         self.latest_version_ever_ready: int = self.latest_version - 1
         self.update_mode = serve_utils.DEFAULT_UPDATE_MODE
 
+    def _setup_replica_bounds(self,
+                              spec: 'service_spec.SkyServiceSpec') -> None:
+        self.min_replicas: int = spec.min_replicas
+        self.max_replicas: int = (spec.max_replicas if spec.max_replicas
+                                  is not None else spec.min_replicas)
+
     def _calculate_target_num_replicas(self) -> int:
         """Calculate target number of replicas."""
         raise NotImplementedError
@@ -154,9 +176,7 @@ class Autoscaler:
                          f'latest version: {self.latest_version}')
             return
         self.latest_version = version
-        self.min_replicas = spec.min_replicas
-        self.max_replicas = (spec.max_replicas if spec.max_replicas is not None
-                             else spec.min_replicas)
+        self._setup_replica_bounds(spec)
         # Re-clip self.target_num_replicas with new min and max replicas.
         self.target_num_replicas = self._clip_target_num_replicas(
             self.target_num_replicas)
@@ -197,6 +217,9 @@ class Autoscaler:
         # TODO(MaoZiming): use NAME to get the class.
         if spec.use_ondemand_fallback:
             return FallbackRequestRateAutoscaler(service_name, spec)
+        elif spec.target_qps_per_replica is None:
+            # Autoscaling is disabled, i.e. min_replicas == max_replicas.
+            return FixedReplicaAutoscaler(service_name, spec)
         else:
             return RequestRateAutoscaler(service_name, spec)
 
@@ -275,6 +298,42 @@ class Autoscaler:
             if info.version < latest_version_with_min_replicas
         ]
 
+    def _generate_scaling_decisions_to_target(
+        self,
+        replica_infos: List['replica_managers.ReplicaInfo'],
+    ) -> List[AutoscalerDecision]:
+        """Scale the latest version's replicas to target_num_replicas."""
+        latest_version = self.latest_version
+        latest_nonterminal_replicas: List['replica_managers.ReplicaInfo'] = [
+            info for info in replica_infos
+            if info.version == latest_version and not info.is_terminal
+        ]
+
+        num_replicas_delta = (self.target_num_replicas -
+                              len(latest_nonterminal_replicas))
+
+        # Case 1. when latest_nonterminal_replicas is less
+        # than num_to_provision, we always scale up new replicas.
+        if num_replicas_delta > 0:
+            logger.info('Number of replicas to scale up: '
+                        f'{num_replicas_delta}')
+            return _generate_scale_up_decisions(num_replicas_delta, None)
+
+        # Case 2: when latest_nonterminal_replicas is more
+        # than self.target_num_replicas, we scale down new replicas.
+        if num_replicas_delta < 0:
+            num_replicas_to_scale_down = -num_replicas_delta
+            replicas_to_scale_down = (
+                _select_nonterminal_replicas_to_scale_down(
+                    num_replicas_to_scale_down, latest_nonterminal_replicas))
+            logger.info(
+                'Number of replicas to scale down: '
+                f'{num_replicas_to_scale_down} {replicas_to_scale_down}')
+            return _generate_scale_down_decisions(replicas_to_scale_down)
+
+        # Case 3: the number of replicas matches the target, nothing to do.
+        return []
+
     def generate_scaling_decisions(
         self,
         replica_infos: List['replica_managers.ReplicaInfo'],
@@ -345,6 +404,41 @@ class Autoscaler:
         self._load_dynamic_states(dynamic_states)
 
 
+class FixedReplicaAutoscaler(Autoscaler):
+    """FixedReplicaAutoscaler: Keep a fixed number of replicas.
+
+    Used when autoscaling is disabled, i.e. target_qps_per_replica is not set
+    and min_replicas == max_replicas. The target is always min_replicas, so
+    it skips recording requests and the hysteresis counters altogether.
+    """
+
+    def _calculate_target_num_replicas(self) -> int:
+        return self.min_replicas
+
+    def update_version(self, version: int, spec: 'service_spec.SkyServiceSpec',
+                       update_mode: serve_utils.UpdateMode) -> None:
+        super().update_version(version, spec, update_mode)
+        self.target_num_replicas = self._calculate_target_num_replicas()
+
+    def collect_request_information(
+            self, request_aggregator_info: Dict[str, Any]) -> None:
+        del request_aggregator_info  # Unused.
+
+    def _generate_scaling_decisions(
+        self,
+        replica_infos: List['replica_managers.ReplicaInfo'],
+    ) -> List[AutoscalerDecision]:
+        """Generate Autoscaling decisions to keep min_replicas replicas."""
+        return self._generate_scaling_decisions_to_target(replica_infos)
+
+    def _dump_dynamic_states(self) -> Dict[str, Any]:
+        return {}
+
+    def _load_dynamic_states(self, dynamic_states: Dict[str, Any]) -> None:
+        if dynamic_states:
+            logger.info(f'Remaining dynamic states: {dynamic_states}')
+
+
 class _AutoscalerWithHysteresis(Autoscaler):
     """_AutoscalerWithHysteresis: Autoscale with hysteresis.
 
@@ -418,14 +512,15 @@ class _AutoscalerWithHysteresis(Autoscaler):
         else:
             self.upscale_counter = self.downscale_counter = 0
 
-        logger.info(
-            f'Old target number of replicas: {old_target_num_replicas}. '
-            f'Current target number of replicas: {target_num_replicas}. '
-            f'Final target number of replicas: {self.target_num_replicas}. '
-            f'Upscale counter: {self.upscale_counter}/'
-            f'{self.scale_up_threshold}. '
-            f'Downscale counter: {self.downscale_counter}/'
-            f'{self.scale_down_threshold}. ')
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f'Old target number of replicas: {old_target_num_replicas}. '
+                f'Current target number of replicas: {target_num_replicas}. '
+                f'Final target number of replicas: {self.target_num_replicas}. '
+                f'Upscale counter: {self.upscale_counter}/'
+                f'{self.scale_up_threshold}. '
+                f'Downscale counter: {self.downscale_counter}/'
+                f'{self.scale_down_threshold}. ')
 
 
 class RequestRateAutoscaler(_AutoscalerWithHysteresis):
@@ -442,30 +537,111 @@ class RequestRateAutoscaler(_AutoscalerWithHysteresis):
 
         Variables:
             target_qps_per_replica: Target qps per replica for autoscaling.
+            qps_aggregation: How the per-second request counts in the window
+                are aggregated into the qps, i.e. mean, max or min.
             qps_window_size: Window size for qps calculating.
-            request_timestamps: All request timestamps within the window.
+            request_buckets: Number of requests received in each second of
+                the window, used as a ring buffer indexed by
+                `second % qps_window_size`.
+            request_bucket_head: The latest second covered by the buckets.
+            num_requests_in_window: Running total of the requests in all
+                buckets, i.e. the number of requests within the window.
+            request_collection_start: The second the autoscaler started to
+                collect requests.
+            last_reported_second: The second of the latest request report
+                from the load balancer, or None before the first report.
+
+        The request states above are read and written by both the controller
+        endpoint reporting the requests and the autoscaler thread computing
+        the request rate, so they are only accessed with _request_lock held.
         """
         super().__init__(service_name, spec)
+        self._setup_request_rate_options(spec)
+        self.qps_window_size: int = constants.AUTOSCALER_QPS_WINDOW_SIZE_SECONDS
+        self.request_buckets: List[int] = [0] * self.qps_window_size
+        self.request_bucket_head: int = int(time.time())
+        self.num_requests_in_window: int = 0
+        self.request_collection_start: int = self.request_bucket_head
+        self.last_reported_second: Optional[int] = None
+        self._request_lock = threading.Lock()
+
+    def _setup_request_rate_options(
+            self, spec: 'service_spec.SkyServiceSpec') -> None:
         self.target_qps_per_replica: Optional[
             float] = spec.target_qps_per_replica
-        self.qps_window_size: int = constants.AUTOSCALER_QPS_WINDOW_SIZE_SECONDS
-        self.request_timestamps: List[float] = []
+        # The target qps as an exact fraction of the value written by the user
+        # (e.g. 0.3 -> 3/10), so the target number of replicas can be
+        # computed in integer arithmetic.
+        self._target_qps_fraction: Optional[fractions.Fraction] = (
+            fractions.Fraction(str(self.target_qps_per_replica))
+            if self.target_qps_per_replica is not None else None)
+        self.qps_aggregation: serve_utils.QpsAggregation = (
+            serve_utils.QpsAggregation(spec.qps_aggregation)
+            if spec.qps_aggregation is not None else
+            serve_utils.DEFAULT_QPS_AGGREGATION)
+
+    def _get_request_rate(self) -> Tuple[int, int]:
+        """Aggregate the per-second request counts in the window.
+
+        Returns:
+            A tuple of (number of requests, number of seconds), so that the
+            qps is their ratio while callers can stay in integer arithmetic.
+        """
+        with self._request_lock:
+            self._advance_request_buckets(int(time.time()))
+            if self.qps_aggregation != serve_utils.QpsAggregation.MEAN:
+                reported_buckets = self._get_reported_request_buckets()
+                if reported_buckets:
+                    if self.qps_aggregation == serve_utils.QpsAggregation.MAX:
+                        return max(reported_buckets), 1
+                    return min(reported_buckets), 1
+                # Nothing has been reported yet, in which case all the
+                # aggregations agree on the mean.
+            return self.num_requests_in_window, self.qps_window_size
+
+    def _get_reported_request_buckets(self) -> List[int]:
+        """Get the buckets of the seconds fully reported by the load balancer.
+
+        Must be called with self._request_lock held.
+
+        The load balancer reports its requests periodically, so the buckets of
+        the seconds after its latest report are empty until the next one,
+        and the second of the report itself may still receive requests. The
+        seconds before the autoscaler started have not been collected. Those
+        buckets are skipped, so that they do not drag the min (or max) of the
+        per-second request counts.
+        """
+        if self.last_reported_second is None:
+            return []
+        first_second = max(self.request_collection_start,
+                           self.request_bucket_head - self.qps_window_size + 1)
+        last_second = min(self.last_reported_second - 1,
+                          self.request_bucket_head)
+        return [
+            self.request_buckets[second % self.qps_window_size]
+            for second in range(first_second, last_second + 1)
+        ]
 
     def _calculate_target_num_replicas(self) -> int:
-        if self.target_qps_per_replica is None:
+        if self._target_qps_fraction is None:
             return self.min_replicas
-        num_requests_per_second = len(
-            self.request_timestamps) / self.qps_window_size
-        target_num_replicas = math.ceil(num_requests_per_second /
-                                        self.target_qps_per_replica)
-        logger.info(f'Requests per second: {num_requests_per_second}. '
-                    f'Target number of replicas: {target_num_replicas}.')
+        num_requests, num_seconds = self._get_request_rate()
+        # ceil((num_requests / num_seconds) / target_qps_per_replica) in
+        # integer arithmetic, so floating point rounding does not flip the
+        # result when the qps is an exact multiple of the target.
+        target_num_replicas = -(
+            -(num_requests * self._target_qps_fraction.denominator) //
+            (num_seconds * self._target_qps_fraction.numerator))
+        if logger.isEnabledFor(logging.INFO):
+            num_requests_per_second = num_requests / num_seconds
+            logger.info(f'Requests per second: {num_requests_per_second}. '
+                        f'Target number of replicas: {target_num_replicas}.')
         return self._clip_target_num_replicas(target_num_replicas)
 
     def update_version(self, version: int, spec: 'service_spec.SkyServiceSpec',
                        update_mode: serve_utils.UpdateMode) -> None:
         super().update_version(version, spec, update_mode)
-        self.target_qps_per_replica = spec.target_qps_per_replica
+        self._setup_request_rate_options(spec)
 
     def collect_request_information(
             self, request_aggregator_info: Dict[str, Any]) -> None:
@@ -474,17 +650,88 @@ class RequestRateAutoscaler(_AutoscalerWithHysteresis):
         request_aggregator_info should be a dict with the following format:
 
         {
-            'timestamps': [timestamp1 (float), timestamp2 (float), ...]
+            'timestamps': [timestamp1 (int), timestamp2 (int), ...]
         }
+
+        Each timestamp is the unix time of a request in whole seconds.
+
+        The timestamps are not required to be sorted, nor to be newer than
+        the ones collected before: each of them is counted into the bucket of
+        its own second, or dropped if it is already out of the window.
+        """
+        if self.target_qps_per_replica is None:
+            # The request rate is not used to decide the number of replicas,
+            # so there is no need to record the requests.
+            return
+        timestamps = request_aggregator_info.get('timestamps')
+        with self._request_lock:
+            now = int(time.time())
+            self._advance_request_buckets(now)
+            if timestamps:
+                self._add_request_timestamps(timestamps)
+            # The load balancer reports all its requests up to now, including
+            # when there is none.
+            self.last_reported_second = max(self.request_bucket_head, now)
+            num_requests_in_window = self.num_requests_in_window
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f'Num of requests in the last {self.qps_window_size} '
+                        f'seconds: {num_requests_in_window}')
+
+    def _add_request_timestamps(self, timestamps: List[int]) -> None:
+        """Count the request timestamps into the buckets of their seconds.
+
+        Must be called with self._request_lock held.
         """
-        self.request_timestamps.extend(
-            request_aggregator_info.get('timestamps', []))
-        current_time = time.time()
-        index = bisect.bisect_left(self.request_timestamps,
-                                   current_time - self.qps_window_size)
-        self.request_timestamps = self.request_timestamps[index:]
-        logger.info(f'Num of requests in the last {self.qps_window_size} '
-                    f'seconds: {len(self.request_timestamps)}')
+        buckets = self.request_buckets
+        head = self.request_bucket_head
+        window_size = self.qps_window_size
+        if len(timestamps) > _NUMPY_TIMESTAMPS_BATCH_SIZE:
+            # Same logic as the loop below, vectorized for large batches.
+            seconds = np.asarray(timestamps, dtype=np.float64).astype(np.int64)
+            seconds = np.minimum(seconds[head - seconds < window_size], head)
+            counts = np.bincount(seconds % window_size, minlength=window_size)
+            for index, count in enumerate(counts.tolist()):
+                buckets[index] += count
+            self.num_requests_in_window += int(seconds.size)
+            return
+        num_added = 0
+        for timestamp in timestamps:
+            second = int(timestamp)
+            if head - second >= window_size:
+                # The request is already out of the window.
+                continue
+            # Requests stamped slightly ahead of the controller's clock (e.g.
+            # clock skew with the load balancer) are counted in the latest
+            # second.
+            second = min(second, head)
+            buckets[second % window_size] += 1
+            num_added += 1
+        self.num_requests_in_window += num_added
+
+    def _advance_request_buckets(self, now: int) -> None:
+        """Move the head of the request buckets to `now`.
+
+        Must be called with self._request_lock held.
+
+        The buckets of the seconds that fall out of the window are zeroed and
+        subtracted from the running total, so the memory used is bounded by
+        the window size instead of the number of requests.
+        """
+        elapsed = now - self.request_bucket_head
+        if elapsed <= 0:
+            # The head only moves forward. If the wall clock goes backwards,
+            # keep the current buckets until the clock catches up, instead of
+            # expiring requests that are still within the window.
+            return
+        if elapsed >= self.qps_window_size:
+            self.request_buckets = [0] * self.qps_window_size
+            self.num_requests_in_window = 0
+        else:
+            for second in range(self.request_bucket_head + 1, now + 1):
+                index = second % self.qps_window_size
+                self.num_requests_in_window -= self.request_buckets[index]
+                self.request_buckets[index] = 0
+        self.request_bucket_head = now
 
     def _generate_scaling_decisions(
         self,
@@ -493,52 +740,33 @@ class RequestRateAutoscaler(_AutoscalerWithHysteresis):
         """Generate Autoscaling decisions based on request rate."""
 
         self._set_target_num_replicas_with_hysteresis()
-
-        latest_nonterminal_replicas: List['replica_managers.ReplicaInfo'] = []
-
-        for info in replica_infos:
-            if info.version == self.latest_version:
-                if not info.is_terminal:
-                    latest_nonterminal_replicas.append(info)
-
-        scaling_decisions: List[AutoscalerDecision] = []
-
-        # Case 1. when latest_nonterminal_replicas is less
-        # than num_to_provision, we always scale up new replicas.
-        if len(latest_nonterminal_replicas) < self.target_num_replicas:
-            num_replicas_to_scale_up = (self.target_num_replicas -
-                                        len(latest_nonterminal_replicas))
-            logger.info('Number of replicas to scale up: '
-                        f'{num_replicas_to_scale_up}')
-            scaling_decisions.extend(
-                _generate_scale_up_decisions(num_replicas_to_scale_up, None))
-
-        # Case 2: when latest_nonterminal_replicas is more
-        # than self.target_num_replicas, we scale down new replicas.
-        replicas_to_scale_down = []
-        if len(latest_nonterminal_replicas) > self.target_num_replicas:
-            num_replicas_to_scale_down = (len(latest_nonterminal_replicas) -
-                                          self.target_num_replicas)
-            replicas_to_scale_down = (
-                _select_nonterminal_replicas_to_scale_down(
-                    num_replicas_to_scale_down, latest_nonterminal_replicas))
-            logger.info(
-                'Number of replicas to scale down: '
-                f'{num_replicas_to_scale_down} {replicas_to_scale_down}')
-
-        scaling_decisions.extend(
-            _generate_scale_down_decisions(replicas_to_scale_down))
-
-        return scaling_decisions
+        return self._generate_scaling_decisions_to_target(replica_infos)
 
     def _dump_dynamic_states(self) -> Dict[str, Any]:
-        return {
-            'request_timestamps': self.request_timestamps,
-        }
+        with self._request_lock:
+            return {
+                'request_buckets': list(self.request_buckets),
+                'request_bucket_head': self.request_bucket_head,
+                'request_collection_start': self.request_collection_start,
+                'last_reported_second': self.last_reported_second,
+            }
 
     def _load_dynamic_states(self, dynamic_states: Dict[str, Any]) -> None:
-        if 'request_timestamps' in dynamic_states:
-            self.request_timestamps = dynamic_states.pop('request_timestamps')
+        with self._request_lock:
+            if ('request_buckets' in dynamic_states and
+                    'request_bucket_head' in dynamic_states):
+                request_buckets = dynamic_states.pop('request_buckets')
+                request_bucket_head = dynamic_states.pop('request_bucket_head')
+                if len(request_buckets) == self.qps_window_size:
+                    self.request_buckets = list(request_buckets)
+                    self.request_bucket_head = request_bucket_head
+                    self.num_requests_in_window = sum(self.request_buckets)
+            if 'request_collection_start' in dynamic_states:
+                self.request_collection_start = dynamic_states.pop(
+                    'request_collection_start')
+            if 'last_reported_second' in dynamic_states:
+                self.last_reported_second = dynamic_states.pop(
+                    'last_reported_second')
         if dynamic_states:
             logger.info(f'Remaining dynamic states: {dynamic_states}')
 
@@ -559,8 +787,11 @@ class FallbackRequestRateAutoscaler(RequestRateAutoscaler):
     """
 
     # job_recovery field is checked earlier in core
-    SPOT_OVERRIDE = {'use_spot': True}
-    ONDEMAND_OVERRIDE = {'use_spot': False}
+    # These overrides are shared by all the scale up decisions (and the
+    # replicas launched with them) instead of being rebuilt per replica, so
+    # they must be treated as read-only by the consumers.
+    SPOT_OVERRIDE: ClassVar[Dict[str, Any]] = {'use_spot': True}
+    ONDEMAND_OVERRIDE: ClassVar[Dict[str, Any]] = {'use_spot': False}
 
     def _setup_fallback_options(self,
                                 spec: 'service_spec.SkyServiceSpec') -> None:
@@ -606,28 +837,33 @@ class FallbackRequestRateAutoscaler(RequestRateAutoscaler):
 
         self._set_target_num_replicas_with_hysteresis()
 
-        latest_nonterminal_replicas = list(
-            filter(
-                lambda info: not info.is_terminal and info.version == self.
-                latest_version, replica_infos))
-        num_nonterminal_spot, num_ready_spot = 0, 0
-        num_nonterminal_ondemand, num_ready_ondemand = 0, 0
-
-        for info in latest_nonterminal_replicas:
+        # Split the latest nonterminal replicas by spot and on-demand, and
+        # count the ready ones, in a single pass over the replica infos.
+        latest_nonterminal_spot: List['replica_managers.ReplicaInfo'] = []
+        latest_nonterminal_ondemand: List['replica_managers.ReplicaInfo'] = []
+        num_ready_spot, num_ready_ondemand = 0, 0
+        ready_status = serve_state.ReplicaStatus.READY
+        latest_version = self.latest_version
+        for info in replica_infos:
+            if info.is_terminal or info.version != latest_version:
+                continue
+            is_ready = info.status == ready_status
             if info.is_spot:
-                if info.status == serve_state.ReplicaStatus.READY:
-                    num_ready_spot += 1
-                num_nonterminal_spot += 1
+                latest_nonterminal_spot.append(info)
+                num_ready_spot += is_ready
             else:
-                if info.status == serve_state.ReplicaStatus.READY:
-                    num_ready_ondemand += 1
-                num_nonterminal_ondemand += 1
+                latest_nonterminal_ondemand.append(info)
+                num_ready_ondemand += is_ready
+        num_nonterminal_spot = len(latest_nonterminal_spot)
+        num_nonterminal_ondemand = len(latest_nonterminal_ondemand)
 
-        logger.info(
-            f'Number of alive spot instances: {num_nonterminal_spot}, '
-            f'Number of ready spot instances: {num_ready_spot}, '
-            f'Number of alive on-demand instances: {num_nonterminal_ondemand}, '
-            f'Number of ready on-demand instances: {num_ready_ondemand}')
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f'Number of alive spot instances: {num_nonterminal_spot}, '
+                f'Number of ready spot instances: {num_ready_spot}, '
+                'Number of alive on-demand instances: '
+                f'{num_nonterminal_ondemand}, '
+                f'Number of ready on-demand instances: {num_ready_ondemand}')
 
         scaling_decisions: List[AutoscalerDecision] = []
         all_replica_ids_to_scale_down: List[int] = []
@@ -635,25 +871,22 @@ class FallbackRequestRateAutoscaler(RequestRateAutoscaler):
         # Decide how many spot instances to launch.
         num_spot_to_provision = (self.target_num_replicas -
                                  self.base_ondemand_fallback_replicas)
-        if num_nonterminal_spot < num_spot_to_provision:
+        num_spot_delta = num_spot_to_provision - num_nonterminal_spot
+        if num_spot_delta > 0:
             # Not enough spot instances, scale up.
-            num_spot_to_scale_up = (num_spot_to_provision -
-                                    num_nonterminal_spot)
+            num_spot_to_scale_up = num_spot_delta
             logger.info('Number of spot instances to scale up: '
                         f'{num_spot_to_scale_up}')
             scaling_decisions.extend(
                 _generate_scale_up_decisions(num_spot_to_scale_up,
                                              self.SPOT_OVERRIDE))
-        elif num_nonterminal_spot > num_spot_to_provision:
+        elif num_spot_delta < 0:
             # Too many spot instances, scale down.
             # Get the replica to scale down with _select_replicas_to_scale_down
-            num_spot_to_scale_down = (num_nonterminal_spot -
-                                      num_spot_to_provision)
+            num_spot_to_scale_down = -num_spot_delta
             replicas_to_scale_down = (
                 _select_nonterminal_replicas_to_scale_down(
-                    num_spot_to_scale_down,
-                    filter(lambda info: info.is_spot,
-                           latest_nonterminal_replicas)))
+                    num_spot_to_scale_down, latest_nonterminal_spot))
             logger.info('Number of spot instances to scale down: '
                         f'{num_spot_to_scale_down} {replicas_to_scale_down}')
             all_replica_ids_to_scale_down.extend(replicas_to_scale_down)
@@ -668,22 +901,20 @@ class FallbackRequestRateAutoscaler(RequestRateAutoscaler):
             num_ondemand_to_provision += (num_spot_to_provision -
                                           num_ready_spot)
 
-        if num_ondemand_to_provision > num_nonterminal_ondemand:
-            num_ondemand_to_scale_up = (num_ondemand_to_provision -
-                                        num_nonterminal_ondemand)
+        num_ondemand_delta = (num_ondemand_to_provision -
+                              num_nonterminal_ondemand)
+        if num_ondemand_delta > 0:
+            num_ondemand_to_scale_up = num_ondemand_delta
             logger.info('Number of on-demand instances to scale up: '
                         f'{num_ondemand_to_scale_up}')
             scaling_decisions.extend(
                 _generate_scale_up_decisions(num_ondemand_to_scale_up,
                                              self.ONDEMAND_OVERRIDE))
-        else:
-            num_ondemand_to_scale_down = (num_nonterminal_ondemand -
-                                          num_ondemand_to_provision)
+        elif num_ondemand_delta < 0:
+            num_ondemand_to_scale_down = -num_ondemand_delta
             replicas_to_scale_down = (
                 _select_nonterminal_replicas_to_scale_down(
-                    num_ondemand_to_scale_down,
-                    filter(lambda info: not info.is_spot,
-                           latest_nonterminal_replicas)))
+                    num_ondemand_to_scale_down, latest_nonterminal_ondemand))
             logger.info(
                 'Number of on-demand instances to scale down: '
                 f'{num_ondemand_to_scale_down} {replicas_to_scale_down}')
@@ -74,7 +74,10 @@ class SkyServeController:
                 assert record is not None, ('No service record found for '
                                             f'{self._service_name}')
                 active_versions = record['active_versions']
-                logger.info(f'All replica info: {replica_infos}')
+                # Formatting every replica info is not free, so skip it when
+                # INFO logs are filtered out.
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f'All replica info: {replica_infos}')
                 scaling_options = self._autoscaler.generate_scaling_decisions(
                     replica_infos, active_versions)
                 for scaling_option in scaling_options:
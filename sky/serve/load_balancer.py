@@ -1,7 +1,6 @@
 """LoadBalancer: Distribute any incoming request to all ready replicas."""
 import asyncio
 import logging
-import threading
 from typing import Dict, Optional, Union
 
 import aiohttp
@@ -18,6 +17,10 @@ from sky.utils import common_utils
 
 logger = sky_logging.init_logger(__name__)
 
+# The timeout in seconds for closing the client of a replica that is no longer
+# ready, so that a hung replica won't block the next sync with the controller.
+_CLIENT_CLOSE_TIMEOUT_SECONDS = 5
+
 
 class SkyServeLoadBalancer:
     """SkyServeLoadBalancer: distribute incoming traffic with proxy.
@@ -64,10 +67,10 @@ class SkyServeLoadBalancer:
         # httpx.Client will queue the requests and send them when a
         # connection is available.
         # Reference: https://github.com/encode/httpcore/blob/a8f80980daaca98d556baea1783c5568775daadc/httpcore/_async/connection_pool.py#L69-L71 # pylint: disable=line-too-long
+        # The client pool is only updated by _sync_with_controller, which runs
+        # on the same event loop as the request handlers and does not await
+        # in the middle of an update, so no lock is needed.
         self._client_pool: Dict[str, httpx.AsyncClient] = dict()
-        # We need this lock to avoid getting from the client pool while
-        # updating it from _sync_with_controller.
-        self._client_pool_lock: threading.Lock = threading.Lock()
 
     async def _sync_with_controller(self):
         """Sync with controller periodically.
@@ -81,9 +84,11 @@ class SkyServeLoadBalancer:
         # Sleep for a while to wait the controller bootstrap.
         await asyncio.sleep(5)
 
-        while True:
-            close_client_tasks = []
-            async with aiohttp.ClientSession() as session:
+        # Reuse a single session across syncs, so the connection to the
+        # controller is kept alive instead of re-established every interval.
+        async with aiohttp.ClientSession() as session:
+            while True:
+                close_client_tasks = []
                 try:
                     # Send request information
                     async with session.post(
@@ -106,25 +111,38 @@ class SkyServeLoadBalancer:
                                  f'the controller: {e}')
                 else:
                     logger.info(f'Available Replica URLs: {ready_replica_urls}')
-                    with self._client_pool_lock:
-                        self._load_balancing_policy.set_ready_replicas(
-                            ready_replica_urls)
-                        for replica_url in ready_replica_urls:
-                            if replica_url not in self._client_pool:
-                                self._client_pool[replica_url] = (
-                                    httpx.AsyncClient(base_url=replica_url))
-                        urls_to_close = set(
-                            self._client_pool.keys()) - set(ready_replica_urls)
-                        client_to_close = []
-                        for replica_url in urls_to_close:
-                            client_to_close.append(
-                                self._client_pool.pop(replica_url))
+                    self._load_balancing_policy.set_ready_replicas(
+                        ready_replica_urls)
+                    old_client_pool = self._client_pool
+                    client_pool: Dict[str, httpx.AsyncClient] = {}
+                    for replica_url in ready_replica_urls:
+                        client = old_client_pool.get(replica_url)
+                        if client is None:
+                            client = httpx.AsyncClient(base_url=replica_url)
+                        client_pool[replica_url] = client
+                    self._client_pool = client_pool
+                    client_to_close = [
+                        client
+                        for replica_url, client in old_client_pool.items()
+                        if replica_url not in client_pool
+                    ]
                     for client in client_to_close:
-                        close_client_tasks.append(client.aclose())
+                        close_client_tasks.append(
+                            asyncio.wait_for(client.aclose(),
+                                             _CLIENT_CLOSE_TIMEOUT_SECONDS))
 
-            await asyncio.sleep(constants.LB_CONTROLLER_SYNC_INTERVAL_SECONDS)
-            # Await those tasks after the interval to avoid blocking.
-            await asyncio.gather(*close_client_tasks)
+                await asyncio.sleep(
+                    constants.LB_CONTROLLER_SYNC_INTERVAL_SECONDS)
+                # Await those tasks after the interval to avoid blocking. The
+                # clients are closed concurrently, and a failure to close one
+                # of them should not stop the sync loop.
+                results = await asyncio.gather(*close_client_tasks,
+                                               return_exceptions=True)
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.warning(
+                            'Failed to close replica client: '
+                            f'{common_utils.format_exception(result)}')
 
     async def _proxy_request_to(
         self, url: str, request: fastapi.Request
@@ -135,16 +153,15 @@ class SkyServeLoadBalancer:
             The response from the endpoint replica. Return the exception
             encountered if anything goes wrong.
         """
-        logger.info(f'Proxy request to {url}')
+        # The selected replica is already logged by the load balancing policy.
+        logger.debug('Proxy request to %s', url)
         self._load_balancing_policy.pre_execute_hook(url, request)
         try:
             # We defer the get of the client here on purpose, for case when the
             # replica is ready in `_proxy_with_retries` but refreshed before
             # entering this function. In that case we will return an error here
-            # and retry to find next ready replica. We also need to wait for the
-            # update of the client pool to finish before getting the client.
-            with self._client_pool_lock:
-                client = self._client_pool.get(url, None)
+            # and retry to find next ready replica.
+            client = self._client_pool.get(url, None)
             if client is None:
                 return RuntimeError(f'Client for {url} not found.')
             worker_url = httpx.URL(path=request.url.path,
@@ -182,9 +199,8 @@ class SkyServeLoadBalancer:
         retry_cnt = 0
         while True:
             retry_cnt += 1
-            with self._client_pool_lock:
-                ready_replica_url = self._load_balancing_policy.select_replica(
-                    request)
+            ready_replica_url = self._load_balancing_policy.select_replica(
+                request)
             if ready_replica_url is None:
                 response_or_exception = fastapi.HTTPException(
                     # 503 means that the server is currently
@@ -1,9 +1,12 @@
 """LoadBalancingPolicy: Policy to select endpoint."""
-import collections
+import heapq
+import itertools
 import random
 import threading
+import types
 import typing
-from typing import Dict, List, Optional
+from typing import (Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple,
+                    Type)
 
 from sky import sky_logging
 
@@ -12,14 +15,20 @@ if typing.TYPE_CHECKING:
 
 logger = sky_logging.init_logger(__name__)
 
-# Define a registry for load balancing policies
-LB_POLICIES = {}
-DEFAULT_LB_POLICY = None
+# Define a registry for load balancing policies. Policies are added with the
+# register_policy decorator, and LB_POLICIES is a read-only view of it.
+_LB_POLICIES: Dict[str, Type['LoadBalancingPolicy']] = {}
+LB_POLICIES = types.MappingProxyType(_LB_POLICIES)
+DEFAULT_LB_POLICY: Optional[str] = None
 # Prior to #4439, the default policy was round_robin. We store the legacy
 # default policy here to maintain backwards compatibility. Remove this after
 # 2 minor release, i.e., 0.9.0.
 LEGACY_DEFAULT_POLICY = 'round_robin'
 
+# The load heap of LeastLoadPolicy is rebuilt when the number of entries,
+# including the stale ones, exceeds this factor of the number of replicas.
+_LOAD_HEAP_COMPACTION_FACTOR = 4
+
 
 def _request_repr(request: 'fastapi.Request') -> str:
     return ('<Request '
@@ -29,19 +38,52 @@ def _request_repr(request: 'fastapi.Request') -> str:
             f'query_params={dict(request.query_params)}>')
 
 
-class LoadBalancingPolicy:
-    """Abstract class for load balancing policies."""
+class _LazyRequestRepr:
+    """Defers formatting a request until the log record is emitted."""
 
-    def __init__(self) -> None:
-        self.ready_replicas: List[str] = []
+    __slots__ = ('request',)
+
+    def __init__(self, request: 'fastapi.Request') -> None:
+        self.request = request
+
+    def __str__(self) -> str:
+        return _request_repr(self.request)
 
-    def __init_subclass__(cls, name: str, default: bool = False):
-        LB_POLICIES[name] = cls
+
+def register_policy(
+    name: str,
+    default: bool = False
+) -> Callable[[Type['LoadBalancingPolicy']], Type['LoadBalancingPolicy']]:
+    """Decorator to register a load balancing policy under a name."""
+
+    def decorator(
+            cls: Type['LoadBalancingPolicy']) -> Type['LoadBalancingPolicy']:
+        assert name not in _LB_POLICIES, f'Policy {name} already registered.'
+        _LB_POLICIES[name] = cls
         if default:
             global DEFAULT_LB_POLICY
             assert DEFAULT_LB_POLICY is None, (
                 'Only one policy can be default.')
             DEFAULT_LB_POLICY = name
+        return cls
+
+    return decorator
+
+
+def _is_same_replica_set(new_replicas: FrozenSet[str],
+                         old_replicas: FrozenSet[str]) -> bool:
+    # The hash of a frozenset is cached after it is first computed, so
+    # comparing hashes rejects a changed set without comparing elements.
+    return (hash(new_replicas) == hash(old_replicas) and
+            new_replicas == old_replicas)
+
+
+class LoadBalancingPolicy:
+    """Abstract class for load balancing policies."""
+
+    def __init__(self) -> None:
+        self.ready_replicas: List[str] = []
+        self._ready_replica_set: FrozenSet[str] = frozenset()
 
     @classmethod
     def make_policy_name(cls, policy_name: Optional[str]) -> str:
@@ -55,21 +97,24 @@ class LoadBalancingPolicy:
     def make(cls, policy_name: Optional[str] = None) -> 'LoadBalancingPolicy':
         """Create a load balancing policy from a name."""
         policy_name = cls.make_policy_name(policy_name)
-        if policy_name not in LB_POLICIES:
+        policy_cls = LB_POLICIES.get(policy_name)
+        if policy_cls is None:
             raise ValueError(f'Unknown load balancing policy: {policy_name}')
-        return LB_POLICIES[policy_name]()
+        return policy_cls()
 
     def set_ready_replicas(self, ready_replicas: List[str]) -> None:
         raise NotImplementedError
 
     def select_replica(self, request: 'fastapi.Request') -> Optional[str]:
         replica = self._select_replica(request)
+        # Use lazy formatting, as copying the headers and query params of
+        # every request is wasted when the log level filters the record out.
         if replica is not None:
-            logger.info(f'Selected replica {replica} '
-                        f'for request {_request_repr(request)}')
+            logger.info('Selected replica %s for request %s', replica,
+                        _LazyRequestRepr(request))
         else:
-            logger.warning('No replica selected for request '
-                           f'{_request_repr(request)}')
+            logger.warning('No replica selected for request %s',
+                           _LazyRequestRepr(request))
         return replica
 
     # TODO(tian): We should have an abstract class for Request to
@@ -86,67 +131,181 @@ class LoadBalancingPolicy:
         pass
 
 
-class RoundRobinPolicy(LoadBalancingPolicy, name='round_robin'):
+@register_policy('round_robin')
+class RoundRobinPolicy(LoadBalancingPolicy):
     """Round-robin load balancing policy."""
 
     def __init__(self) -> None:
         super().__init__()
-        self.index = 0
+        self._replica_cycle: Iterator[str] = itertools.cycle([])
 
     def set_ready_replicas(self, ready_replicas: List[str]) -> None:
-        if set(self.ready_replicas) == set(ready_replicas):
+        ready_replica_set = frozenset(ready_replicas)
+        if _is_same_replica_set(ready_replica_set, self._ready_replica_set):
             return
         # If the autoscaler keeps scaling up and down the replicas,
         # we need this shuffle to not let the first replica have the
-        # most of the load.
+        # most of the load. Shuffle a copy, as the cycle keeps reading from
+        # the list and the caller may still modify its own.
+        ready_replicas = list(ready_replicas)
         random.shuffle(ready_replicas)
         self.ready_replicas = ready_replicas
-        self.index = 0
+        self._ready_replica_set = ready_replica_set
+        # Publish the new cycle with a single assignment, so concurrent
+        # selections see either the old or the new replicas.
+        self._replica_cycle = itertools.cycle(ready_replicas)
 
     def _select_replica(self, request: 'fastapi.Request') -> Optional[str]:
         del request  # Unused.
-        if not self.ready_replicas:
-            return None
-        ready_replica_url = self.ready_replicas[self.index]
-        self.index = (self.index + 1) % len(self.ready_replicas)
-        return ready_replica_url
+        # next() on an itertools.cycle is atomic under the GIL, so concurrent
+        # selections never read-modify-write a shared index and each replica
+        # is picked evenly without a lock. The cycle of an empty list is
+        # exhausted right away.
+        return next(self._replica_cycle, None)
 
 
-class LeastLoadPolicy(LoadBalancingPolicy, name='least_load', default=True):
-    """Least load load balancing policy."""
+class _LoadTrackingPolicy(LoadBalancingPolicy):
+    """Base class for policies tracking in-flight requests of replicas."""
 
     def __init__(self) -> None:
         super().__init__()
-        self.load_map: Dict[str, int] = collections.defaultdict(int)
+        # Number of in-flight requests of each replica, keyed by replica url.
+        # The load balancer selects replicas and runs the hooks on its single
+        # event loop, with no await between reading and writing a count, so
+        # the updates cannot interleave there. The lock only matters for
+        # callers on other threads, where `+=` on a dict item is a separate
+        # load, add and store. Selections read the counts without the lock
+        # where the policy allows it.
+        self.load_map: Dict[str, int] = {}
         self.lock = threading.Lock()
 
     def set_ready_replicas(self, ready_replicas: List[str]) -> None:
-        if set(self.ready_replicas) == set(ready_replicas):
+        ready_replica_set = frozenset(ready_replicas)
+        if _is_same_replica_set(ready_replica_set, self._ready_replica_set):
             return
         with self.lock:
-            self.ready_replicas = ready_replicas
-            for r in self.ready_replicas:
-                if r not in ready_replicas:
-                    del self.load_map[r]
-            for replica in ready_replicas:
-                self.load_map[replica] = self.load_map.get(replica, 0)
+            self._update_ready_replicas(ready_replicas, ready_replica_set)
 
-    def _select_replica(self, request: 'fastapi.Request') -> Optional[str]:
-        del request  # Unused.
-        if not self.ready_replicas:
-            return None
-        with self.lock:
-            return min(self.ready_replicas,
-                       key=lambda replica: self.load_map.get(replica, 0))
+    def _update_ready_replicas(self, ready_replicas: List[str],
+                               ready_replica_set: FrozenSet[str]) -> None:
+        # Must be called with self.lock held. Only the new load map is built
+        # here, as it has to see the latest loads. The replicas that are no
+        # longer ready keep their counters until their in-flight requests
+        # drain, so that the counters are still right if they come back.
+        self.ready_replicas = ready_replicas
+        self._ready_replica_set = ready_replica_set
+        load_map = {
+            replica: load
+            for replica, load in self.load_map.items()
+            if load > 0 and replica not in ready_replica_set
+        }
+        for replica in ready_replicas:
+            load_map[replica] = self.load_map.get(replica, 0)
+        self.load_map = load_map
+
+    def _update_load(self, replica_url: str, delta: int) -> None:
+        # Must be called with self.lock held. Requests to a replica that is
+        # not tracked are ignored, and the counter of a replica that is no
+        # longer ready is dropped once its in-flight requests drain.
+        load = self.load_map.get(replica_url)
+        if load is None:
+            return
+        load += delta
+        if load <= 0 and replica_url not in self._ready_replica_set:
+            del self.load_map[replica_url]
+        else:
+            self.load_map[replica_url] = load
 
     def pre_execute_hook(self, replica_url: str,
                          request: 'fastapi.Request') -> None:
         del request  # Unused.
         with self.lock:
-            self.load_map[replica_url] += 1
+            self._update_load(replica_url, 1)
 
     def post_execute_hook(self, replica_url: str,
                           request: 'fastapi.Request') -> None:
         del request  # Unused.
         with self.lock:
-            self.load_map[replica_url] -= 1
+            self._update_load(replica_url, -1)
+
+
+@register_policy('least_load', default=True)
+class LeastLoadPolicy(_LoadTrackingPolicy):
+    """Least load load balancing policy."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Min-heap of (load, sequence, replica). An entry is stale if the
+        # replica is no longer ready or its load changed after the entry was
+        # pushed. Stale entries are dropped lazily when they reach the top.
+        self._load_heap: List[Tuple[int, int, str]] = []
+        self._load_heap_sequence = itertools.count()
+
+    def _rebuild_load_heap(self) -> None:
+        # Must be called with self.lock held. Every ready replica is in the
+        # load map, so look the loads up with the bound __getitem__ and let
+        # zip draw the sequence numbers, without a Python-level call per
+        # replica.
+        self._load_heap = list(
+            zip(map(self.load_map.__getitem__, self.ready_replicas),
+                self._load_heap_sequence, self.ready_replicas))
+        heapq.heapify(self._load_heap)
+
+    def _update_ready_replicas(self, ready_replicas: List[str],
+                               ready_replica_set: FrozenSet[str]) -> None:
+        super()._update_ready_replicas(ready_replicas, ready_replica_set)
+        self._rebuild_load_heap()
+
+    def _update_load(self, replica_url: str, delta: int) -> None:
+        super()._update_load(replica_url, delta)
+        if replica_url not in self._ready_replica_set:
+            return
+        if (len(self._load_heap) >
+                _LOAD_HEAP_COMPACTION_FACTOR * len(self._ready_replica_set)):
+            self._rebuild_load_heap()
+            return
+        heapq.heappush(self._load_heap,
+                       (self.load_map[replica_url],
+                        next(self._load_heap_sequence), replica_url))
+
+    def _select_replica(self, request: 'fastapi.Request') -> Optional[str]:
+        del request  # Unused.
+        if not self.ready_replicas:
+            return None
+        with self.lock:
+            while self._load_heap:
+                load, _, replica = self._load_heap[0]
+                if (replica in self._ready_replica_set and
+                        load == self.load_map[replica]):
+                    return replica
+                heapq.heappop(self._load_heap)
+            return None
+
+
+@register_policy('power_of_two_choices')
+class PowerOfTwoChoicesPolicy(_LoadTrackingPolicy):
+    """Power of two choices load balancing policy.
+
+    Samples two ready replicas uniformly at random and selects the less loaded
+    one. Compared to always selecting the least loaded replica, this avoids
+    herding concurrent requests onto the same replica before its load is
+    updated.
+    """
+
+    def _select_replica(self, request: 'fastapi.Request') -> Optional[str]:
+        del request  # Unused.
+        # The selection does not take the lock. Read the list only once, as
+        # set_ready_replicas may replace it concurrently.
+        ready_replicas = self.ready_replicas
+        if not ready_replicas:
+            return None
+        if len(ready_replicas) == 1:
+            return ready_replicas[0]
+        first, second = random.sample(ready_replicas, 2)
+        # Compare both loads from the same map, which may be replaced by
+        # set_ready_replicas concurrently. A replica missing from it has just
+        # become ready.
+        load_map = self.load_map
+        if load_map.get(first, 0) <= load_map.get(second, 0):
+            return first
+        return second
@@ -48,6 +48,7 @@ _PROCESS_POOL_REFRESH_INTERVAL = 20
 _CONSECUTIVE_FAILURE_THRESHOLD_TIMEOUT = 180
 _RETRY_INIT_GAP_SECONDS = 60
 _DEFAULT_DRAIN_SECONDS = 120
+_PROBE_BODY_CHUNK_SIZE = 1024
 
 # Since sky.launch is very resource demanding, we limit the number of
 # concurrent sky.launch process to avoid overloading the machine.
@@ -514,6 +515,12 @@ class ReplicaInfo:
                 return self, False, probe_time
             readiness_path = (f'{url}{readiness_path}')
             logger.info(f'Probing {replica_identity} with {readiness_path}.')
+            # A POST probe exercises the model, so it is only ready once the
+            # whole body is received. A GET probe is usually a health check
+            # whose body does not matter, so stream the response and only
+            # wait for the first chunk of the body on success, which still
+            # fails the probe if the body stalls or errors out. The whole
+            # body is downloaded if the probe fails, as it is logged.
             if post_data is not None:
                 msg += 'POST'
                 response = requests.post(readiness_path,
@@ -524,16 +531,22 @@ class ReplicaInfo:
                 msg += 'GET'
                 response = requests.get(readiness_path,
                                         headers=headers,
-                                        timeout=timeout)
-            msg += (f' request to {replica_identity} returned status '
-                    f'code {response.status_code}')
-            if response.status_code == 200:
-                msg += '.'
-                log_method = logger.info
-            else:
-                msg += f' and response {response.text}.'
-                msg = f'{colorama.Fore.YELLOW}{msg}{colorama.Style.RESET_ALL}'
-                log_method = logger.error
+                                        timeout=timeout,
+                                        stream=True)
+            with response:
+                msg += (f' request to {replica_identity} returned status '
+                        f'code {response.status_code}')
+                if response.status_code == 200:
+                    if post_data is None:
+                        next(response.iter_content(_PROBE_BODY_CHUNK_SIZE),
+                             None)
+                    msg += '.'
+                    log_method = logger.info
+                else:
+                    msg += f' and response {response.text}.'
+                    msg = (f'{colorama.Fore.YELLOW}{msg}'
+                           f'{colorama.Style.RESET_ALL}')
+                    log_method = logger.error
             log_method(msg)
             if response.status_code == 200:
                 logger.debug(f'{replica_identity.capitalize()} is ready.')
@@ -630,6 +643,9 @@ class SkyPilotReplicaManager(ReplicaManager):
             int, multiprocessing.Process] = serve_utils.ThreadSafeDict()
         self._down_process_pool: serve_utils.ThreadSafeDict[
             int, multiprocessing.Process] = serve_utils.ThreadSafeDict()
+        # Reuse one thread pool across readiness probes instead of spinning up
+        # and tearing down worker threads every probe interval.
+        self._probe_pool = mp_pool.ThreadPool()
 
         threading.Thread(target=self._process_pool_refresher).start()
         threading.Thread(target=self._job_status_fetcher).start()
@@ -1034,98 +1050,103 @@ class SkyPilotReplicaManager(ReplicaManager):
         """
         probe_futures = []
         replica_to_probe = []
-        with mp_pool.ThreadPool() as pool:
-            infos = serve_state.get_replica_infos(self._service_name)
-            for info in infos:
-                if not info.status_property.should_track_service_status():
+        # Load the spec of each version once per probe, instead of querying
+        # the database for every field of every replica.
+        version_specs: Dict[int, 'service_spec.SkyServiceSpec'] = {}
+        infos = serve_state.get_replica_infos(self._service_name)
+        for info in infos:
+            if not info.status_property.should_track_service_status():
+                continue
+            if info.version not in version_specs:
+                version_specs[info.version] = self._get_version_spec(
+                    info.version)
+            spec = version_specs[info.version]
+            replica_to_probe.append(
+                f'replica_{info.replica_id}(url={info.url})')
+            probe_futures.append(
+                self._probe_pool.apply_async(
+                    info.probe,
+                    (
+                        spec.readiness_path,
+                        spec.post_data,
+                        spec.readiness_timeout_seconds,
+                        spec.readiness_headers,
+                    ),
+                ),)
+        logger.info(f'Replicas to probe: {", ".join(replica_to_probe)}')
+
+        # Since futures.as_completed will return futures in the order of
+        # completion, we need the info.probe function to return the info
+        # object as well, so that we could update the info object in the
+        # same order.
+        for future in probe_futures:
+            future_result: Tuple[ReplicaInfo, bool, float] = future.get()
+            info, probe_succeeded, probe_time = future_result
+            info.status_property.service_ready_now = probe_succeeded
+            should_teardown = False
+            if probe_succeeded:
+                if self._uptime is None:
+                    self._uptime = probe_time
+                    logger.info(f'Replica {info.replica_id} is the first ready '
+                                f'replica. Setting uptime to {self._uptime}.')
+                    serve_state.set_service_uptime(self._service_name,
+                                                   int(self._uptime))
+                info.consecutive_failure_times.clear()
+                if info.status_property.first_ready_time is None:
+                    info.status_property.first_ready_time = probe_time
+            else:
+                # TODO(tian): This might take a lot of time. Shouldn't
+                # blocking probe to other replicas.
+                is_preempted = self._handle_preemption(info)
+                if is_preempted:
                     continue
-                replica_to_probe.append(
-                    f'replica_{info.replica_id}(url={info.url})')
-                probe_futures.append(
-                    pool.apply_async(
-                        info.probe,
-                        (
-                            self._get_readiness_path(info.version),
-                            self._get_post_data(info.version),
-                            self._get_readiness_timeout_seconds(info.version),
-                            self._get_readiness_headers(info.version),
-                        ),
-                    ),)
-            logger.info(f'Replicas to probe: {", ".join(replica_to_probe)}')
-
-            # Since futures.as_completed will return futures in the order of
-            # completion, we need the info.probe function to return the info
-            # object as well, so that we could update the info object in the
-            # same order.
-            for future in probe_futures:
-                future_result: Tuple[ReplicaInfo, bool, float] = future.get()
-                info, probe_succeeded, probe_time = future_result
-                info.status_property.service_ready_now = probe_succeeded
-                should_teardown = False
-                if probe_succeeded:
-                    if self._uptime is None:
-                        self._uptime = probe_time
+
+                if info.first_not_ready_time is None:
+                    info.first_not_ready_time = probe_time
+                if info.status_property.first_ready_time is not None:
+                    info.consecutive_failure_times.append(probe_time)
+                    consecutive_failure_time = (
+                        info.consecutive_failure_times[-1] -
+                        info.consecutive_failure_times[0])
+                    if (consecutive_failure_time >=
+                            _CONSECUTIVE_FAILURE_THRESHOLD_TIMEOUT):
+                        logger.info(
+                            f'Replica {info.replica_id} is not ready for '
+                            'too long and exceeding consecutive failure '
+                            'threshold. Terminating the replica...')
+                        should_teardown = True
+                    else:
                         logger.info(
-                            f'Replica {info.replica_id} is the first ready '
-                            f'replica. Setting uptime to {self._uptime}.')
-                        serve_state.set_service_uptime(self._service_name,
-                                                       int(self._uptime))
-                    info.consecutive_failure_times.clear()
-                    if info.status_property.first_ready_time is None:
-                        info.status_property.first_ready_time = probe_time
+                            f'Replica {info.replica_id} is not ready '
+                            'but within consecutive failure threshold '
+                            f'({consecutive_failure_time}s / '
+                            f'{_CONSECUTIVE_FAILURE_THRESHOLD_TIMEOUT}s). '
+                            'Skipping.')
                 else:
-                    # TODO(tian): This might take a lot of time. Shouldn't
-                    # blocking probe to other replicas.
-                    is_preempted = self._handle_preemption(info)
-                    if is_preempted:
-                        continue
-
-                    if info.first_not_ready_time is None:
-                        info.first_not_ready_time = probe_time
-                    if info.status_property.first_ready_time is not None:
-                        info.consecutive_failure_times.append(probe_time)
-                        consecutive_failure_time = (
-                            info.consecutive_failure_times[-1] -
-                            info.consecutive_failure_times[0])
-                        if (consecutive_failure_time >=
-                                _CONSECUTIVE_FAILURE_THRESHOLD_TIMEOUT):
-                            logger.info(
-                                f'Replica {info.replica_id} is not ready for '
-                                'too long and exceeding consecutive failure '
-                                'threshold. Terminating the replica...')
-                            should_teardown = True
-                        else:
-                            logger.info(
-                                f'Replica {info.replica_id} is not ready '
-                                'but within consecutive failure threshold '
-                                f'({consecutive_failure_time}s / '
-                                f'{_CONSECUTIVE_FAILURE_THRESHOLD_TIMEOUT}s). '
-                                'Skipping.')
+                    initial_delay_seconds = version_specs[
+                        info.version].initial_delay_seconds
+                    current_delay_seconds = (probe_time -
+                                             info.first_not_ready_time)
+                    if current_delay_seconds > initial_delay_seconds:
+                        logger.info(
+                            f'Replica {info.replica_id} is not ready and '
+                            'exceeding initial delay seconds. Terminating '
+                            'the replica...')
+                        should_teardown = True
+                        info.status_property.first_ready_time = -1.0
                     else:
-                        initial_delay_seconds = self._get_initial_delay_seconds(
-                            info.version)
-                        current_delay_seconds = (probe_time -
-                                                 info.first_not_ready_time)
-                        if current_delay_seconds > initial_delay_seconds:
-                            logger.info(
-                                f'Replica {info.replica_id} is not ready and '
-                                'exceeding initial delay seconds. Terminating '
-                                'the replica...')
-                            should_teardown = True
-                            info.status_property.first_ready_time = -1.0
-                        else:
-                            current_delay_seconds = int(current_delay_seconds)
-                            logger.info(f'Replica {info.replica_id} is not '
-                                        'ready but within initial delay '
-                                        f'seconds ({current_delay_seconds}s '
-                                        f'/ {initial_delay_seconds}s). '
-                                        'Skipping.')
-                serve_state.add_or_update_replica(self._service_name,
-                                                  info.replica_id, info)
-                if should_teardown:
-                    self._terminate_replica(info.replica_id,
-                                            sync_down_logs=True,
-                                            replica_drain_delay_seconds=0)
+                        current_delay_seconds = int(current_delay_seconds)
+                        logger.info(f'Replica {info.replica_id} is not '
+                                    'ready but within initial delay '
+                                    f'seconds ({current_delay_seconds}s '
+                                    f'/ {initial_delay_seconds}s). '
+                                    'Skipping.')
+            serve_state.add_or_update_replica(self._service_name,
+                                              info.replica_id, info)
+            if should_teardown:
+                self._terminate_replica(info.replica_id,
+                                        sync_down_logs=True,
+                                        replica_drain_delay_seconds=0)
 
     def _replica_prober(self) -> None:
         """Periodically probe replicas."""
@@ -1223,18 +1244,3 @@ class SkyPilotReplicaManager(ReplicaManager):
         if spec is None:
             raise ValueError(f'Version {version} not found.')
         return spec
-
-    def _get_readiness_path(self, version: int) -> str:
-        return self._get_version_spec(version).readiness_path
-
-    def _get_post_data(self, version: int) -> Optional[Dict[str, Any]]:
-        return self._get_version_spec(version).post_data
-
-    def _get_readiness_headers(self, version: int) -> Optional[Dict[str, str]]:
-        return self._get_version_spec(version).readiness_headers
-
-    def _get_initial_delay_seconds(self, version: int) -> int:
-        return self._get_version_spec(version).initial_delay_seconds
-
-    def _get_readiness_timeout_seconds(self, version: int) -> int:
-        return self._get_version_spec(version).readiness_timeout_seconds
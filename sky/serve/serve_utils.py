@@ -91,6 +91,13 @@ class UpdateMode(enum.Enum):
     BLUE_GREEN = 'blue_green'
 
 
+class QpsAggregation(enum.Enum):
+    """Aggregation of the per-second request counts in the QPS window."""
+    MEAN = 'mean'
+    MAX = 'max'
+    MIN = 'min'
+
+
 @dataclasses.dataclass
 class TLSCredential:
     """TLS credential for the service."""
@@ -105,6 +112,7 @@ class TLSCredential:
 
 
 DEFAULT_UPDATE_MODE = UpdateMode.ROLLING
+DEFAULT_QPS_AGGREGATION = QpsAggregation.MEAN
 
 _SIGNAL_TO_ERROR = {
     UserSignal.TERMINATE: exceptions.ServeUserTerminatedError,
@@ -177,16 +185,19 @@ class RequestsAggregator:
 class RequestTimestamp(RequestsAggregator):
     """RequestTimestamp: Aggregates request timestamps.
 
-    This is useful for QPS-based autoscaling.
+    This is useful for QPS-based autoscaling. The autoscaler counts requests
+    per second, so the timestamps are kept at a granularity of whole seconds,
+    which keeps the payload synced to the controller small and cheap to
+    decode.
     """
 
     def __init__(self) -> None:
-        self.timestamps: List[float] = []
+        self.timestamps: List[int] = []
 
     def add(self, request: 'fastapi.Request') -> None:
         """Add a request to the request aggregator."""
         del request  # unused
-        self.timestamps.append(time.time())
+        self.timestamps.append(int(time.time()))
 
     def clear(self) -> None:
         """Clear all current request aggregator."""
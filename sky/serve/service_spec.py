@@ -27,6 +27,7 @@ class SkyServiceSpec:
         max_replicas: Optional[int] = None,
         ports: Optional[str] = None,
         target_qps_per_replica: Optional[float] = None,
+        qps_aggregation: Optional[str] = None,
         post_data: Optional[Dict[str, Any]] = None,
         tls_credential: Optional[serve_utils.TLSCredential] = None,
         readiness_headers: Optional[Dict[str, str]] = None,
@@ -48,6 +49,11 @@ class SkyServiceSpec:
                 with ux_utils.print_exception_no_traceback():
                     raise ValueError('max_replicas must be set where '
                                      'target_qps_per_replica is set.')
+        elif qps_aggregation is not None:
+            with ux_utils.print_exception_no_traceback():
+                raise ValueError('qps_aggregation is only used for '
+                                 'autoscaling. Please set '
+                                 'target_qps_per_replica to use it.')
         else:
             if max_replicas is not None and max_replicas != min_replicas:
                 with ux_utils.print_exception_no_traceback():
@@ -61,6 +67,17 @@ class SkyServiceSpec:
                 raise ValueError('readiness_path must start with a slash (/). '
                                  f'Got: {readiness_path}')
 
+        if qps_aggregation is not None:
+            qps_aggregation = qps_aggregation.lower()
+            qps_aggregations = [
+                aggregation.value for aggregation in serve_utils.QpsAggregation
+            ]
+            if qps_aggregation not in qps_aggregations:
+                with ux_utils.print_exception_no_traceback():
+                    raise ValueError(
+                        f'Unknown qps aggregation: {qps_aggregation}. '
+                        f'Available aggregations: {qps_aggregations}')
+
         # Add the check for unknown load balancing policies
         if (load_balancing_policy is not None and
                 load_balancing_policy not in serve.LB_POLICIES):
@@ -75,6 +92,7 @@ class SkyServiceSpec:
         self._max_replicas: Optional[int] = max_replicas
         self._ports: Optional[str] = ports
         self._target_qps_per_replica: Optional[float] = target_qps_per_replica
+        self._qps_aggregation: Optional[str] = qps_aggregation
         self._post_data: Optional[Dict[str, Any]] = post_data
         self._tls_credential: Optional[serve_utils.TLSCredential] = (
             tls_credential)
@@ -157,6 +175,7 @@ class SkyServiceSpec:
             service_config['min_replicas'] = min_replicas
             service_config['max_replicas'] = None
             service_config['target_qps_per_replica'] = None
+            service_config['qps_aggregation'] = None
             service_config['upscale_delay_seconds'] = None
             service_config['downscale_delay_seconds'] = None
         else:
@@ -165,6 +184,8 @@ class SkyServiceSpec:
                 'max_replicas', None)
             service_config['target_qps_per_replica'] = policy_section.get(
                 'target_qps_per_replica', None)
+            service_config['qps_aggregation'] = policy_section.get(
+                'qps_aggregation', None)
             service_config['upscale_delay_seconds'] = policy_section.get(
                 'upscale_delay_seconds', None)
             service_config['downscale_delay_seconds'] = policy_section.get(
@@ -235,6 +256,8 @@ class SkyServiceSpec:
         add_if_not_none('replica_policy', 'max_replicas', self.max_replicas)
         add_if_not_none('replica_policy', 'target_qps_per_replica',
                         self.target_qps_per_replica)
+        add_if_not_none('replica_policy', 'qps_aggregation',
+                        self.qps_aggregation)
         add_if_not_none('replica_policy', 'dynamic_ondemand_fallback',
                         self.dynamic_ondemand_fallback)
         add_if_not_none('replica_policy', 'base_ondemand_fallback_replicas',
@@ -289,9 +312,12 @@ class SkyServiceSpec:
         assert self.target_qps_per_replica is not None
         # TODO(tian): Refactor to contain more information
         max_plural = '' if self.max_replicas == 1 else 's'
+        qps_aggregation_str = ''
+        if self.qps_aggregation is not None:
+            qps_aggregation_str = f', QPS aggregation: {self.qps_aggregation}'
         return (f'Autoscaling from {self.min_replicas} to {self.max_replicas} '
                 f'replica{max_plural} (target QPS per replica: '
-                f'{self.target_qps_per_replica})')
+                f'{self.target_qps_per_replica}{qps_aggregation_str})')
 
     def set_ports(self, ports: str) -> None:
         self._ports = ports
@@ -342,6 +368,10 @@ class SkyServiceSpec:
     def target_qps_per_replica(self) -> Optional[float]:
         return self._target_qps_per_replica
 
+    @property
+    def qps_aggregation(self) -> Optional[str]:
+        return self._qps_aggregation
+
     @property
     def post_data(self) -> Optional[Dict[str, Any]]:
         return self._post_data
@@ -13,7 +13,7 @@ import re
 import socket
 import sys
 import time
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import uuid
 
 import jinja2
@@ -41,6 +41,12 @@ _COLOR_PATTERN = re.compile(r'\x1b[^m]*m')
 
 _VALID_ENV_VAR_REGEX = '[a-zA-Z_][a-zA-Z0-9_]*'
 
+# Validators of the schemas validated against, keyed by the id of the schema.
+# The schema getters in sky.utils.schemas are cached, so the same schema
+# objects are passed in repeatedly and their validators can be reused.
+_SCHEMA_VALIDATOR_CACHE_SIZE = 32
+_schema_validators: Dict[int, Tuple[Dict[str, Any], Any]] = {}
+
 logger = sky_logging.init_logger(__name__)
 
 
@@ -576,6 +582,20 @@ def format_float(num: Union[float, int], precision: int = 1) -> str:
     return '{:.0f}'.format(num) if num.is_integer() else f'{num:.{precision}f}'
 
 
+def _get_schema_validator(schema: Dict[str, Any]) -> Any:
+    """Returns a validator for the schema, reusing a previously built one."""
+    entry = _schema_validators.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+    if len(_schema_validators) >= _SCHEMA_VALIDATOR_CACHE_SIZE:
+        _schema_validators.clear()
+    schema_validator = validator.SchemaValidator(schema)
+    # Keep a reference to the schema, so that its id is not reused by another
+    # object while the entry is cached.
+    _schema_validators[id(schema)] = (schema, schema_validator)
+    return schema_validator
+
+
 def validate_schema(obj, schema, err_msg_prefix='', skip_none=True):
     """Validates an object against a given JSON schema.
 
@@ -595,7 +615,7 @@ def validate_schema(obj, schema, err_msg_prefix='', skip_none=True):
         obj = {k: v for k, v in obj.items() if v is not None}
     err_msg = None
     try:
-        validator.SchemaValidator(schema).validate(obj)
+        _get_schema_validator(schema).validate(obj)
     except jsonschema.ValidationError as e:
         if e.validator == 'additionalProperties':
             if tuple(e.schema_path) == ('properties', 'envs',
@@ -7,6 +7,7 @@ import enum
 from typing import Any, Dict, List, Tuple
 
 from sky.skylet import constants
+from sky.utils import annotations
 
 
 def _check_not_both_fields_present(field1: str, field2: str):
@@ -33,6 +34,15 @@ def _check_not_both_fields_present(field1: str, field2: str):
     }
 
 
+def _without_schema_meta(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns a shallow copy of the schema without the `$schema` key.
+
+    Validation may fail if `$schema` is included in a nested schema.
+    """
+    return {k: v for k, v in schema.items() if k != '$schema'}
+
+
+@annotations.lru_cache(scope='global', maxsize=1)
 def _get_single_resources_schema():
     """Schema for a single resource in a resources list."""
     # To avoid circular imports, only import when needed.
@@ -196,20 +206,21 @@ def _get_single_resources_schema():
     }
 
 
+@annotations.lru_cache(scope='global', maxsize=1)
 def _get_multi_resources_schema():
-    multi_resources_schema = {
-        k: v
-        for k, v in _get_single_resources_schema().items()
-        # Validation may fail if $schema is included.
-        if k != '$schema'
-    }
-    return multi_resources_schema
+    return _without_schema_meta(_get_single_resources_schema())
 
 
+@annotations.lru_cache(scope='global', maxsize=1)
 def get_resources_schema():
     """Resource schema in task config."""
-    single_resources_schema = _get_single_resources_schema()['properties']
-    single_resources_schema.pop('accelerators')
+    # The cached single resources schema is shared, so it is not modified
+    # in place.
+    single_resources_schema = {
+        k: v
+        for k, v in _get_single_resources_schema()['properties'].items()
+        if k != 'accelerators'
+    }
     multi_resources_schema = _get_multi_resources_schema()
     return {
         '$schema': 'http://json-schema.org/draft-07/schema#',
@@ -254,6 +265,7 @@ def get_resources_schema():
     }
 
 
+@annotations.lru_cache(scope='global', maxsize=1)
 def get_storage_schema():
     # pylint: disable=import-outside-toplevel
     from sky.data import storage
@@ -305,49 +317,46 @@ def get_storage_schema():
     }
 
 
+@annotations.lru_cache(scope='global', maxsize=1)
 def get_service_schema():
     """Schema for top-level `service:` field (for SkyServe)."""
     # To avoid circular imports, only import when needed.
     # pylint: disable=import-outside-toplevel
     from sky.serve import load_balancing_policies
+    from sky.serve import serve_utils
     return {
         '$schema': 'https://json-schema.org/draft/2020-12/schema',
         'type': 'object',
         'required': ['readiness_probe'],
         'additionalProperties': False,
         'properties': {
+            # Either a path string or an object. The object keywords are
+            # ignored for strings, so a single schema accepts both without
+            # validating the instance against each branch of an anyOf.
             'readiness_probe': {
-                'anyOf': [{
-                    'type': 'string',
-                }, {
-                    'type': 'object',
-                    'required': ['path'],
-                    'additionalProperties': False,
-                    'properties': {
-                        'path': {
-                            'type': 'string',
-                        },
-                        'initial_delay_seconds': {
-                            'type': 'number',
-                        },
-                        'timeout_seconds': {
-                            'type': 'number',
-                        },
-                        'post_data': {
-                            'anyOf': [{
-                                'type': 'string',
-                            }, {
-                                'type': 'object',
-                            }]
-                        },
-                        'headers': {
-                            'type': 'object',
-                            'additionalProperties': {
-                                'type': 'string'
-                            }
-                        },
-                    }
-                }]
+                'type': ['string', 'object'],
+                'required': ['path'],
+                'additionalProperties': False,
+                'properties': {
+                    'path': {
+                        'type': 'string',
+                    },
+                    'initial_delay_seconds': {
+                        'type': 'number',
+                    },
+                    'timeout_seconds': {
+                        'type': 'number',
+                    },
+                    'post_data': {
+                        'type': ['string', 'object'],
+                    },
+                    'headers': {
+                        'type': 'object',
+                        'additionalProperties': {
+                            'type': 'string'
+                        }
+                    },
+                }
             },
             'replica_policy': {
                 'type': 'object',
@@ -366,6 +375,13 @@ def get_service_schema():
                         'type': 'number',
                         'minimum': 0,
                     },
+                    'qps_aggregation': {
+                        'type': 'string',
+                        'case_insensitive_enum': [
+                            aggregation.value
+                            for aggregation in serve_utils.QpsAggregation
+                        ],
+                    },
                     'dynamic_ondemand_fallback': {
                         'type': 'boolean',
                     },
@@ -477,6 +493,7 @@ def _experimental_task_schema() -> dict:
     }
 
 
+@annotations.lru_cache(scope='global', maxsize=1)
 def get_task_schema():
     return {
         '$schema': 'https://json-schema.org/draft/2020-12/schema',
@@ -550,6 +567,7 @@ def get_task_schema():
     }
 
 
+@annotations.lru_cache(scope='global', maxsize=1)
 def get_cluster_schema():
     return {
         '$schema': 'https://json-schema.org/draft/2020-12/schema',
@@ -705,18 +723,16 @@ _REMOTE_IDENTITY_SCHEMA_KUBERNETES = {
 }
 
 
+@annotations.lru_cache(scope='global', maxsize=1)
 def get_config_schema():
     # pylint: disable=import-outside-toplevel
     from sky.clouds import service_catalog
     from sky.utils import kubernetes_enums
 
-    resources_schema = {
-        k: v
-        for k, v in get_resources_schema().items()
-        # Validation may fail if $schema is included.
-        if k != '$schema'
+    resources_schema = _without_schema_meta(get_resources_schema())
+    resources_schema['properties'] = {
+        k: v for k, v in resources_schema['properties'].items() if k != 'ports'
     }
-    resources_schema['properties'].pop('ports')
     controller_resources_schema = {
         'type': 'object',
         'required': [],
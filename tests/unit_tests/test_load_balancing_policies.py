@@ -0,0 +1,154 @@
+import collections
+from concurrent import futures
+import types
+from unittest import mock
+
+import pytest
+
+from sky.serve import load_balancing_policies as lb_policies
+
+
+def _make_request() -> types.SimpleNamespace:
+    return types.SimpleNamespace(method='GET',
+                                 url='http://lb/',
+                                 headers={},
+                                 query_params={})
+
+
+def test_least_load_policy_selects_least_loaded_replica() -> None:
+    policy = lb_policies.LeastLoadPolicy()
+    request = _make_request()
+    assert policy.select_replica(request) is None
+    policy.set_ready_replicas(['a', 'b', 'c'])
+    for replica in ['a', 'a', 'b', 'c', 'c']:
+        policy.pre_execute_hook(replica, request)
+    assert policy.select_replica(request) == 'b'
+    policy.pre_execute_hook('b', request)
+    policy.pre_execute_hook('b', request)
+    policy.post_execute_hook('a', request)
+    assert policy.select_replica(request) == 'a'
+    policy.set_ready_replicas(['b', 'c'])
+    assert policy.select_replica(request) == 'c'
+
+
+def test_least_load_policy_many_requests() -> None:
+    policy = lb_policies.LeastLoadPolicy()
+    request = _make_request()
+    replicas = [f'replica-{i}' for i in range(10)]
+    policy.set_ready_replicas(list(replicas))
+    selected = []
+    for _ in range(100):
+        replica = policy.select_replica(request)
+        assert replica is not None
+        policy.pre_execute_hook(replica, request)
+        selected.append(replica)
+    assert all(policy.load_map[replica] == 10 for replica in replicas)
+    for replica in selected:
+        policy.post_execute_hook(replica, request)
+    assert all(policy.load_map[replica] == 0 for replica in replicas)
+    # pylint: disable=protected-access
+    assert (len(policy._load_heap) <=
+            lb_policies._LOAD_HEAP_COMPACTION_FACTOR * len(replicas) + 1)
+
+
+def test_power_of_two_choices_policy() -> None:
+    policy = lb_policies.PowerOfTwoChoicesPolicy()
+    request = _make_request()
+    assert policy.select_replica(request) is None
+    policy.set_ready_replicas(['a'])
+    assert policy.select_replica(request) == 'a'
+    policy.set_ready_replicas(['a', 'b'])
+    policy.pre_execute_hook('a', request)
+    # With two replicas, both are always sampled.
+    for _ in range(10):
+        assert policy.select_replica(request) == 'b'
+    policy.post_execute_hook('a', request)
+    assert policy.load_map['a'] == 0
+
+
+def test_least_load_policy_drops_removed_replicas() -> None:
+    policy = lb_policies.LeastLoadPolicy()
+    request = _make_request()
+    policy.set_ready_replicas(['a', 'b'])
+    policy.pre_execute_hook('a', request)
+    policy.set_ready_replicas(['b', 'c'])
+    # The removed replica is kept until its in-flight request finishes.
+    assert policy.load_map == {'a': 1, 'b': 0, 'c': 0}
+    assert policy.select_replica(request) in ('b', 'c')
+    policy.post_execute_hook('a', request)
+    assert policy.load_map == {'b': 0, 'c': 0}
+
+
+def test_least_load_policy_readds_draining_replica() -> None:
+    policy = lb_policies.LeastLoadPolicy()
+    request = _make_request()
+    policy.set_ready_replicas(['a', 'b'])
+    for _ in range(3):
+        policy.pre_execute_hook('a', request)
+    policy.set_ready_replicas(['b'])
+    policy.set_ready_replicas(['a', 'b'])
+    assert policy.load_map == {'a': 3, 'b': 0}
+    assert policy.select_replica(request) == 'b'
+    for _ in range(3):
+        policy.post_execute_hook('a', request)
+    assert policy.load_map == {'a': 0, 'b': 0}
+
+
+def test_make_policy() -> None:
+    assert isinstance(lb_policies.LoadBalancingPolicy.make(),
+                      lb_policies.LeastLoadPolicy)
+    assert isinstance(lb_policies.LoadBalancingPolicy.make('round_robin'),
+                      lb_policies.RoundRobinPolicy)
+    with pytest.raises(ValueError):
+        lb_policies.LoadBalancingPolicy.make('unknown')
+    with pytest.raises(TypeError):
+        lb_policies.LB_POLICIES['unknown'] = lb_policies.RoundRobinPolicy
+
+
+def test_round_robin_policy() -> None:
+    policy = lb_policies.RoundRobinPolicy()
+    request = _make_request()
+    assert policy.select_replica(request) is None
+    policy.set_ready_replicas(['a', 'b', 'c'])
+    selected = [policy.select_replica(request) for _ in range(6)]
+    assert selected[:3] == selected[3:]
+    assert sorted(selected[:3]) == ['a', 'b', 'c']
+    policy.set_ready_replicas([])
+    assert policy.select_replica(request) is None
+
+
+def test_round_robin_policy_concurrent_selection() -> None:
+    policy = lb_policies.RoundRobinPolicy()
+    request = _make_request()
+    replicas = [f'replica-{i}' for i in range(4)]
+    policy.set_ready_replicas(replicas)
+    # The caller's list is not shuffled in place.
+    assert replicas == [f'replica-{i}' for i in range(4)]
+    with futures.ThreadPoolExecutor(max_workers=8) as executor:
+        selected = list(
+            executor.map(lambda _: policy.select_replica(request), range(400)))
+    assert collections.Counter(selected) == {
+        replica: 100 for replica in replicas
+    }
+
+
+@pytest.mark.parametrize('policy_cls', [
+    lb_policies.LeastLoadPolicy,
+    lb_policies.PowerOfTwoChoicesPolicy,
+])
+def test_load_tracking_concurrent_hooks(policy_cls) -> None:
+    policy = policy_cls()
+    request = _make_request()
+    replicas = [f'replica-{i}' for i in range(4)]
+    policy.set_ready_replicas(replicas)
+
+    def handle_requests(_) -> None:
+        for _ in range(1000):
+            replica = policy.select_replica(request)
+            policy.pre_execute_hook(replica, request)
+            policy.post_execute_hook(replica, request)
+
+    with mock.patch.object(lb_policies.logger, 'info'):
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(handle_requests, range(8)))
+    assert policy.load_map == {replica: 0 for replica in replicas}
@@ -0,0 +1,266 @@
+from concurrent import futures
+import copy
+import pickle
+import time
+import types
+from unittest import mock
+
+import pytest
+
+from sky.serve import autoscalers
+from sky.serve import serve_state
+from sky.serve import service_spec
+
+
+def _make_spec(**kwargs) -> service_spec.SkyServiceSpec:
+    params = {
+        'readiness_path': '/',
+        'initial_delay_seconds': 10,
+        'readiness_timeout_seconds': 10,
+        'min_replicas': 1,
+        'max_replicas': 10,
+        'target_qps_per_replica': 1,
+    }
+    params.update(kwargs)
+    return service_spec.SkyServiceSpec(**params)
+
+
+def _make_replica_info(replica_id: int,
+                       status: serve_state.ReplicaStatus,
+                       version: int = 1,
+                       is_spot: bool = False) -> types.SimpleNamespace:
+    return types.SimpleNamespace(
+        replica_id=replica_id,
+        status=status,
+        version=version,
+        is_spot=is_spot,
+        is_terminal=status in serve_state.ReplicaStatus.terminal_statuses(),
+        is_ready=status == serve_state.ReplicaStatus.READY)
+
+
+def _to_tuples(decisions):
+    return [(decision.operator, decision.target) for decision in decisions]
+
+
+def test_autoscaler_decision_copy_and_pickle() -> None:
+    decision = autoscalers.AutoscalerDecision(
+        autoscalers.AutoscalerDecisionOperator.SCALE_UP, {'use_spot': True})
+    assert copy.deepcopy(decision) == decision
+    assert pickle.loads(pickle.dumps(decision)) == decision
+
+
+def test_select_nonterminal_replicas_to_scale_down_order() -> None:
+    status = serve_state.ReplicaStatus
+    replica_infos = [
+        _make_replica_info(1, status.READY),
+        _make_replica_info(2, status.STARTING),
+        _make_replica_info(3, status.READY, version=2),
+        _make_replica_info(4, status.PROVISIONING),
+        _make_replica_info(5, status.STARTING),
+        _make_replica_info(6, status.READY),
+    ]
+    # pylint: disable=protected-access
+    select = autoscalers._select_nonterminal_replicas_to_scale_down
+    assert select(0, replica_infos) == []
+    assert select(3, replica_infos) == [4, 5, 2]
+    assert select(6, replica_infos) == [4, 5, 2, 6, 1, 3]
+
+
+def test_collect_request_information_expires_old_requests() -> None:
+    autoscaler = autoscalers.RequestRateAutoscaler('test-service', _make_spec())
+    now = time.time()
+    window = autoscaler.qps_window_size
+    autoscaler.collect_request_information(
+        {'timestamps': [now - window - 10, now - window - 5]})
+    autoscaler.collect_request_information(
+        {'timestamps': [now - 2, now - 1, now]})
+    assert autoscaler.num_requests_in_window == 3
+    assert sum(autoscaler.request_buckets) == 3
+
+
+def test_collect_request_information_unsorted_timestamps() -> None:
+    autoscaler = autoscalers.RequestRateAutoscaler('test-service', _make_spec())
+    now = time.time()
+    window = autoscaler.qps_window_size
+    autoscaler.collect_request_information(
+        {'timestamps': [now - 1, now - window - 1, now - 30, now + 5, now]})
+    # The expired timestamp is dropped, and the one ahead of the controller's
+    # clock is counted in the latest second.
+    assert autoscaler.num_requests_in_window == 4
+    autoscaler.collect_request_information({'timestamps': [now - 20]})
+    assert autoscaler.num_requests_in_window == 5
+
+
+def test_collect_request_information_large_batch() -> None:
+    now = time.time()
+    # Freeze the clock so both autoscalers see the same window.
+    with mock.patch('time.time', return_value=now):
+        small_batch_autoscaler = autoscalers.RequestRateAutoscaler(
+            'test-service', _make_spec())
+        large_batch_autoscaler = autoscalers.RequestRateAutoscaler(
+            'test-service', _make_spec())
+        window = small_batch_autoscaler.qps_window_size
+        timestamps = [now - i * 0.05 for i in range(-20, 2 * window * 20)]
+        large_batch_autoscaler.collect_request_information(
+            {'timestamps': timestamps})
+        for i in range(0, len(timestamps), 100):
+            small_batch_autoscaler.collect_request_information(
+                {'timestamps': timestamps[i:i + 100]})
+    assert (large_batch_autoscaler.request_buckets ==
+            small_batch_autoscaler.request_buckets)
+    assert (large_batch_autoscaler.num_requests_in_window ==
+            small_batch_autoscaler.num_requests_in_window)
+
+
+def test_collect_request_information_without_target_qps() -> None:
+    autoscaler = autoscalers.RequestRateAutoscaler(
+        'test-service', _make_spec(max_replicas=1, target_qps_per_replica=None))
+    autoscaler.collect_request_information({'timestamps': [time.time()]})
+    assert autoscaler.num_requests_in_window == 0
+
+
+def test_qps_aggregation() -> None:
+    start = 1_000_000
+    # Steady 10 qps reported every 20 seconds, with one burst of 5 more
+    # requests in the second before the latest report.
+    expected_rates = {'mean': (495, 60), 'max': (15, 1), 'min': (10, 1)}
+    for aggregation, rate in expected_rates.items():
+        with mock.patch('time.time') as mock_time:
+            mock_time.return_value = start
+            autoscaler = autoscalers.RequestRateAutoscaler(
+                'test-service', _make_spec(qps_aggregation=aggregation))
+            for num_syncs in range(1, 5):
+                now = start + 20 * num_syncs
+                mock_time.return_value = now
+                timestamps = [
+                    second for second in range(now - 20, now) for _ in range(10)
+                ]
+                if num_syncs == 4:
+                    timestamps.extend([now - 1] * 5)
+                autoscaler.collect_request_information(
+                    {'timestamps': timestamps})
+            # The decision is made in between two reports, so the latest
+            # seconds do not have any request yet.
+            mock_time.return_value = now + 10
+            # pylint: disable=protected-access
+            assert autoscaler._get_request_rate() == rate
+
+
+def test_qps_aggregation_validation() -> None:
+    spec = _make_spec(qps_aggregation='MAX')
+    assert spec.qps_aggregation == 'max'
+    assert 'QPS aggregation: max' in spec.autoscaling_policy_str()
+    with pytest.raises(ValueError, match='Unknown qps aggregation'):
+        _make_spec(qps_aggregation='median')
+    with pytest.raises(ValueError, match='target_qps_per_replica'):
+        _make_spec(target_qps_per_replica=None, qps_aggregation='max')
+
+
+def test_request_rate_with_concurrent_reports() -> None:
+    autoscaler = autoscalers.RequestRateAutoscaler('test-service', _make_spec())
+    now = time.time()
+
+    def report(_) -> None:
+        for i in range(200):
+            autoscaler.collect_request_information(
+                {'timestamps': [now - i % 30] * 5})
+            # pylint: disable=protected-access
+            autoscaler._get_request_rate()
+
+    with mock.patch.object(autoscalers.logger, 'info'):
+        with futures.ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(report, range(8)))
+    assert autoscaler.num_requests_in_window == sum(autoscaler.request_buckets)
+    assert autoscaler.num_requests_in_window == 8 * 200 * 5
+
+
+def test_calculate_target_num_replicas() -> None:
+    autoscaler = autoscalers.RequestRateAutoscaler(
+        'test-service', _make_spec(target_qps_per_replica=0.3))
+    now = time.time()
+    # 126 requests in 60 seconds is 2.1 qps, i.e. exactly 7 replicas, which
+    # floating point division would round up to 8.
+    autoscaler.collect_request_information(
+        {'timestamps': [now - i % 30 for i in range(126)]})
+    # pylint: disable=protected-access
+    assert autoscaler._calculate_target_num_replicas() == 7
+    autoscaler.collect_request_information({'timestamps': [now]})
+    assert autoscaler._calculate_target_num_replicas() == 8
+
+
+def test_request_buckets_survive_autoscaler_switch() -> None:
+    old_autoscaler = autoscalers.RequestRateAutoscaler('test-service',
+                                                       _make_spec())
+    now = time.time()
+    old_autoscaler.collect_request_information(
+        {'timestamps': [now - 3, now - 2, now - 1]})
+    new_autoscaler = autoscalers.FallbackRequestRateAutoscaler(
+        'test-service', _make_spec(base_ondemand_fallback_replicas=1))
+    new_autoscaler.load_dynamic_states(old_autoscaler.dump_dynamic_states())
+    assert new_autoscaler.num_requests_in_window == 3
+
+
+def test_fallback_autoscaler_replaces_extra_spot_with_ondemand() -> None:
+    autoscaler = autoscalers.FallbackRequestRateAutoscaler(
+        'test-service',
+        _make_spec(min_replicas=2,
+                   max_replicas=2,
+                   target_qps_per_replica=None,
+                   base_ondemand_fallback_replicas=1))
+    status = serve_state.ReplicaStatus
+    replica_infos = [
+        _make_replica_info(1, status.READY, is_spot=True),
+        _make_replica_info(2, status.STARTING, is_spot=True),
+        _make_replica_info(3, status.SHUTTING_DOWN, is_spot=False),
+    ]
+    # pylint: disable=protected-access
+    decisions = autoscaler._generate_scaling_decisions(replica_infos)
+    assert _to_tuples(decisions) == [
+        (autoscalers.AutoscalerDecisionOperator.SCALE_UP, {
+            'use_spot': False
+        }),
+        (autoscalers.AutoscalerDecisionOperator.SCALE_DOWN, 2),
+    ]
+
+
+def test_request_rate_autoscaler_scaling_decisions() -> None:
+    autoscaler = autoscalers.RequestRateAutoscaler(
+        'test-service',
+        _make_spec(min_replicas=2, max_replicas=2, target_qps_per_replica=None))
+    status = serve_state.ReplicaStatus
+    # pylint: disable=protected-access
+    decisions = autoscaler._generate_scaling_decisions(
+        [_make_replica_info(1, status.READY)])
+    assert _to_tuples(decisions) == [
+        (autoscalers.AutoscalerDecisionOperator.SCALE_UP, None)
+    ]
+    decisions = autoscaler._generate_scaling_decisions([
+        _make_replica_info(1, status.READY),
+        _make_replica_info(2, status.READY),
+    ])
+    assert decisions == []
+    decisions = autoscaler._generate_scaling_decisions([
+        _make_replica_info(1, status.READY),
+        _make_replica_info(2, status.READY),
+        _make_replica_info(3, status.PROVISIONING),
+    ])
+    assert _to_tuples(decisions) == [
+        (autoscalers.AutoscalerDecisionOperator.SCALE_DOWN, 3)
+    ]
+
+
+def test_from_spec_fixed_replicas() -> None:
+    autoscaler = autoscalers.Autoscaler.from_spec(
+        'test-service',
+        _make_spec(min_replicas=2, max_replicas=2, target_qps_per_replica=None))
+    assert isinstance(autoscaler, autoscalers.FixedReplicaAutoscaler)
+    autoscaler.collect_request_information({'timestamps': [time.time()]})
+    status = serve_state.ReplicaStatus
+    # pylint: disable=protected-access
+    decisions = autoscaler._generate_scaling_decisions(
+        [_make_replica_info(1, status.READY)])
+    assert _to_tuples(decisions) == [
+        (autoscalers.AutoscalerDecisionOperator.SCALE_UP, None)
+    ]
+    autoscaler = autoscalers.Autoscaler.from_spec('test-service', _make_spec())
+    assert isinstance(autoscaler, autoscalers.RequestRateAutoscaler)